@@ -555,46 +555,49 @@ def check_is_good_execution_for_cml_vs_circuit():
 
         fhe_mode = "simulate" if simulate else "execute"
 
-        for _ in range(n_allowed_runs):
-            # Check if model is QuantizedModule
-            if isinstance(model, QuantizedModule):
-                y_pred_fhe = model.forward(*inputs, fhe=fhe_mode)
-                y_pred_quantized = model.forward(*inputs, fhe="disable")
+        # Check if model is QuantizedModule
+        if isinstance(model, QuantizedModule):
+            predict_method = model.forward
+
+        else:
+            assert isinstance(
+                model,
+                (
+                    QuantizedTorchEstimatorMixin,
+                    BaseTreeEstimatorMixin,
+                    SklearnLinearModelMixin,
+                    SklearnKNeighborsMixin,
+                ),
+            )
+
+            if model._is_a_public_cml_model:  # pylint: disable=protected-access
+                # Only check probabilities for classifiers as we only want to check that the
+                # circuit is outputs (after de-quantization) are correct. We thus want to avoid
+                # as much post-processing steps in the clear (that could lead to more flaky
+                # tests), especially since these results are tested in other tests such as the
+                # `check_subfunctions_in_fhe`
+                # For KNN `predict_proba` is not supported for now
+                # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/3962
+                if is_classifier_or_partial_classifier(model) and not isinstance(
+                    model, SklearnKNeighborsMixin
+                ):
+                    predict_method = model.predict_proba
+
+                else:
+                    predict_method = model.predict
 
             else:
-                assert isinstance(
-                    model,
-                    (
-                        QuantizedTorchEstimatorMixin,
-                        BaseTreeEstimatorMixin,
-                        SklearnLinearModelMixin,
-                        SklearnKNeighborsMixin,
-                    ),
+                raise ValueError(
+                    "numpy_function should be a built-in concrete sklearn model or "
+                    "a QuantizedModule object."
                 )
 
-                if model._is_a_public_cml_model:  # pylint: disable=protected-access
-                    # Only check probabilities for classifiers as we only want to check that the
-                    # circuit is outputs (after de-quantization) are correct. We thus want to avoid
-                    # as much post-processing steps in the clear (that could lead to more flaky
-                    # tests), especially since these results are tested in other tests such as the
-                    # `check_subfunctions_in_fhe`
-                    # For KNN `predict_proba` is not supported for now
-                    # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/3962
-                    if is_classifier_or_partial_classifier(model) and not isinstance(
-                        model, SklearnKNeighborsMixin
-                    ):
-                        y_pred_fhe = model.predict_proba(*inputs, fhe=fhe_mode)
-                        y_pred_quantized = model.predict_proba(*inputs, fhe="disable")
-
-                    else:
-                        y_pred_fhe = model.predict(*inputs, fhe=fhe_mode)
-                        y_pred_quantized = model.predict(*inputs, fhe="disable")
+        # The clear quantized inference is deterministic, so it only needs to be computed once.
+        # Only the FHE execution (or simulation) is run again in case of mismatch
+        y_pred_quantized = predict_method(*inputs, fhe="disable")
 
-                else:
-                    raise ValueError(
-                        "numpy_function should be a built-in concrete sklearn model or "
-                        "a QuantizedModule object."
-                    )
+        for _ in range(n_allowed_runs):
+            y_pred_fhe = predict_method(*inputs, fhe=fhe_mode)
 
             if array_allclose_and_same_shape(y_pred_fhe, y_pred_quantized):
                 return
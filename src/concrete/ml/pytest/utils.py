@@ -527,7 +527,8 @@ def load_torch_model(
 
     if state_dict_or_path is not None:
         if isinstance(state_dict_or_path, (str, Path)):
-            state_dict = torch.load(state_dict_or_path, map_location=device)
+            # State dicts only contain tensors, so the restricted unpickler can be used
+            state_dict = torch.load(state_dict_or_path, map_location=device, weights_only=True)
         else:
             state_dict = state_dict_or_path
         model.load_state_dict(state_dict)
@@ -748,6 +749,10 @@ def pandas_dataframe_are_equal(
         equal_nan=equal_nan,
     ).all()
 
+    # If the float columns already differ, there is no need to compare the other columns
+    if not float_equal:
+        return False
+
     # Select other columns (integers, objects, ...)
     non_float_columns = df_1.select_dtypes(exclude="float").columns
 
@@ -771,4 +776,4 @@ def pandas_dataframe_are_equal(
     # Check if non-float columns contain the same values
     string_equal = df_1.eq(df_2).all().all()
 
-    return float_equal and string_equal
+    return string_equal
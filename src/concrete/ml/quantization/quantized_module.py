@@ -654,49 +654,58 @@ class QuantizedModule:
             "The quantized module is not compiled. Please run compile(...) first before "
             "executing it in FHE.",
         )
-        q_result_by_output: List[List[numpy.ndarray]] = [[] for _ in self.output_quantizers]
-        for i in range(q_x[0].shape[0]):
-
-            # Extract example i from every element in the tuple q_x
-            q_input = tuple(q_x[input][[i]] for input in range(len(q_x)))
-
-            # For mypy
-            assert self.fhe_circuit is not None
+        # For mypy
+        assert self.fhe_circuit is not None
+
+        # If the inference should be executed using simulation
+        if simulate:
+            is_crt_encoding = self.fhe_circuit.statistics["packing_key_switch_count"] != 0
+
+            # If the virtual library method should be used
+            # For now, use the virtual library when simulating
+            # circuits that use CRT  encoding because the official simulation is too slow
+            # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/4391
+            if USE_OLD_VL or is_crt_encoding:
+                predict_method = partial(
+                    self.fhe_circuit.graph, p_error=self.fhe_circuit.p_error
+                )  # pragma: no cover
+
+            # Else, use the official simulation method
+            else:
+                predict_method = self.fhe_circuit.simulate
 
-            # If the inference should be executed using simulation
-            if simulate:
-                is_crt_encoding = self.fhe_circuit.statistics["packing_key_switch_count"] != 0
+        # Else, use the FHE execution method
+        else:
+            predict_method = self.fhe_circuit.encrypt_run_decrypt
 
-                # If the virtual library method should be used
-                # For now, use the virtual library when simulating
-                # circuits that use CRT  encoding because the official simulation is too slow
-                # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/4391
-                if USE_OLD_VL or is_crt_encoding:
-                    predict_method = partial(
-                        self.fhe_circuit.graph, p_error=self.fhe_circuit.p_error
-                    )  # pragma: no cover
+        n_examples = q_x[0].shape[0]
 
-                # Else, use the official simulation method
-                else:
-                    predict_method = self.fhe_circuit.simulate
+        # Output buffers are allocated once the output shapes are known, that is after the first
+        # example's execution, and then filled in place in the same loop for all outputs
+        q_result_by_output: List[numpy.ndarray] = []
+        for i in range(n_examples):
 
-            # Else, use the FHE execution method
-            else:
-                predict_method = self.fhe_circuit.encrypt_run_decrypt
+            # Extract example i from every element in the tuple q_x. Slicing returns a view of
+            # the example instead of a copy
+            q_input = tuple(q_x[input][i : i + 1] for input in range(len(q_x)))
 
             # Execute the forward pass in FHE or with simulation
             q_result = to_tuple(predict_method(*q_input))
 
-            assert len(q_result) == len(q_result_by_output), (
+            assert len(q_result) == len(self.output_quantizers), (
                 "Number of outputs does not match the number of output quantizers.\n"
                 f"{len(q_result)=}!={len(self.output_quantizers)=}"
             )
+
+            if i == 0:
+                q_result_by_output = [
+                    numpy.empty((n_examples, *elt.shape[1:]), dtype=elt.dtype) for elt in q_result
+                ]
+
             for elt_index, elt in enumerate(q_result):
-                q_result_by_output[elt_index].append(elt)
+                q_result_by_output[elt_index][i : i + 1] = elt
 
-        q_results: Tuple[numpy.ndarray, ...] = tuple(
-            numpy.concatenate(elt, axis=0) for elt in q_result_by_output
-        )
+        q_results: Tuple[numpy.ndarray, ...] = tuple(q_result_by_output)
         if len(q_results) == 1:
             return q_results[0]
         return q_results
@@ -53,6 +53,7 @@ If we don't reach the convergence, a user warning is raised.
 
 import warnings
 from collections import OrderedDict
+from functools import partial
 from pathlib import Path
 from pprint import pprint
 from typing import Any, Callable, Dict, List, Tuple, Union
@@ -66,23 +67,19 @@ from ..sklearn import _get_sklearn_all_models, _get_sklearn_linear_models
 from ..torch.compile import compile_brevitas_qat_model, compile_torch_model
 
 
-def compile_and_simulated_fhe_inference(
+def _compile_for_simulation(
     estimator: torch.nn.Module,
     calibration_data: numpy.ndarray,
     ground_truth: numpy.ndarray,
     p_error: float,
     n_bits: int,
     is_qat: bool,
-    metric: Callable,
     predict: str,
-    **kwargs: Dict,
-) -> Tuple[numpy.ndarray, float]:
-    """Get the quantized module of a given model in FHE, simulated or not.
+) -> Callable[[numpy.ndarray], numpy.ndarray]:
+    """Compile a given model and return its inference function in FHE simulation.
 
-    Supported models are:
-    - Built-in models, including trees and QNN,
-    - Quantized aware trained model are supported using Brevitas framework,
-    - Torch models can be converted into post-trained quantized models.
+    Compilation does not depend on the simulated noise, so the returned function can be called
+    several times to sample different simulations without re-compiling the model.
 
     Args:
         estimator (torch.nn.Module): Torch model or a built-in model
@@ -92,13 +89,10 @@ def compile_and_simulated_fhe_inference(
         n_bits (int): Quantization bits
         is_qat (bool): True, if the NN has been trained through QAT.
             If `False` it is converted into post-trained quantized model.
-        metric (Callable): Classification or regression evaluation metric.
         predict (str): The predict method to use.
-        kwargs (Dict): Hyper-parameters to use for the metric.
 
     Returns:
-        Tuple[numpy.ndarray, float]: De-quantized or quantized output model depending on
-        `is_benchmark_test` and the score.
+        Callable[[numpy.ndarray], numpy.ndarray]: The inference function in FHE simulation.
 
     Raises:
         ValueError: If the model is neither a built-in model nor a torch neural network.
@@ -106,7 +100,6 @@ def compile_and_simulated_fhe_inference(
 
     compile_params: Dict = {}
     compile_function: Callable[..., Any]
-    dequantized_output: numpy.ndarray
 
     # Custom neural networks with QAT
     if isinstance(estimator, torch.nn.Module):
@@ -124,9 +117,9 @@ def compile_and_simulated_fhe_inference(
             **compile_params,
         )
 
-        dequantized_output = quantized_module.forward(calibration_data, fhe="simulate")
+        return partial(quantized_module.forward, fhe="simulate")
 
-    elif is_model_class_in_a_list(
+    if is_model_class_in_a_list(
         estimator, _get_sklearn_all_models()
     ) and not is_model_class_in_a_list(estimator, _get_sklearn_linear_models()):
         if not estimator.is_fitted:
@@ -134,13 +127,60 @@ def compile_and_simulated_fhe_inference(
 
         estimator.compile(calibration_data, p_error=p_error)
         predict_method = getattr(estimator, predict)
-        dequantized_output = predict_method(calibration_data, fhe="simulate")
+        return partial(predict_method, fhe="simulate")
 
-    else:
-        raise ValueError(
-            f"`{type(estimator)}` is not supported. "
-            "Supported types are: custom Torch, Brevitas NNs and built-in models (trees and QNNs)."
-        )
+    raise ValueError(
+        f"`{type(estimator)}` is not supported. "
+        "Supported types are: custom Torch, Brevitas NNs and built-in models (trees and QNNs)."
+    )
+
+
+def compile_and_simulated_fhe_inference(
+    estimator: torch.nn.Module,
+    calibration_data: numpy.ndarray,
+    ground_truth: numpy.ndarray,
+    p_error: float,
+    n_bits: int,
+    is_qat: bool,
+    metric: Callable,
+    predict: str,
+    **kwargs: Dict,
+) -> Tuple[numpy.ndarray, float]:
+    """Get the quantized module of a given model in FHE, simulated or not.
+
+    Supported models are:
+    - Built-in models, including trees and QNN,
+    - Quantized aware trained model are supported using Brevitas framework,
+    - Torch models can be converted into post-trained quantized models.
+
+    Args:
+        estimator (torch.nn.Module): Torch model or a built-in model
+        calibration_data (numpy.ndarray): Calibration data required for compilation
+        ground_truth (numpy.ndarray): The ground truth
+        p_error (float): Concrete ML uses table lookup (TLU) to represent any non-linear
+        n_bits (int): Quantization bits
+        is_qat (bool): True, if the NN has been trained through QAT.
+            If `False` it is converted into post-trained quantized model.
+        metric (Callable): Classification or regression evaluation metric.
+        predict (str): The predict method to use.
+        kwargs (Dict): Hyper-parameters to use for the metric.
+
+    Returns:
+        Tuple[numpy.ndarray, float]: De-quantized or quantized output model depending on
+        `is_benchmark_test` and the score.
+    """
+
+    simulate_function = _compile_for_simulation(
+        estimator=estimator,
+        calibration_data=calibration_data,
+        ground_truth=ground_truth,
+        p_error=p_error,
+        n_bits=n_bits,
+        is_qat=is_qat,
+        predict=predict,
+    )
+
+    dequantized_output = simulate_function(calibration_data)
 
     score = metric(ground_truth, dequantized_output, **kwargs)
 
@@ -336,8 +376,9 @@ class BinarySearch:
         # Compute inference errors
         l1_error = abs_difference.mean()
         l2_error = numpy.sqrt(l1_error)
-        count_error = (reference_output != estimated_output).sum()
-        mean_error = (reference_output != estimated_output).mean()
+        is_error = reference_output != estimated_output
+        count_error = is_error.sum()
+        mean_error = is_error.mean()
 
         # Check if `p_error_i` matches the condition
         match = difference <= self.max_metric_loss
@@ -450,21 +491,24 @@ class BinarySearch:
         for _ in tqdm(range(self.max_iter), disable=not self.verbose):
             # Run the inference with a given p-error
 
+            # The compilation only depends on the `p_error`, so the model is compiled once and
+            # shared by all the simulations of the current iteration
+            simulate_function = _compile_for_simulation(
+                estimator=self.estimator,
+                calibration_data=x,
+                ground_truth=ground_truth,
+                p_error=self.p_error,
+                is_qat=self.is_qat,
+                n_bits=self.n_bits,
+                predict=self.predict,
+            )
+
             # Since `p_error` represents a probability, to validate the results of the Fhe
             # simulation and get a stable estimation, several runs are needed
             simulation_data = []
             for _ in range(self.n_simulation):
-                current_output, current_score = compile_and_simulated_fhe_inference(
-                    estimator=self.estimator,
-                    calibration_data=x,
-                    ground_truth=ground_truth,
-                    p_error=self.p_error,
-                    is_qat=self.is_qat,
-                    n_bits=self.n_bits,
-                    metric=self.metric,
-                    predict=self.predict,
-                    **self.kwargs,
-                )
+                current_output = simulate_function(x)
+                current_score = self.metric(ground_truth, current_output, **self.kwargs)
 
                 current_metadata = self._acc_diff_objective(
                     reference_output=reference_output,
@@ -656,42 +656,50 @@ class BaseEstimator:
             # Check that the model is properly compiled
             self.check_model_is_compiled()
 
-            q_y_pred_list = []
-            for q_X_i in q_X:
-                # Expected encrypt_run_decrypt output shape is (1, n_features) while q_X_i
-                # is of shape (n_features,)
-                q_X_i = numpy.expand_dims(q_X_i, 0)
-
-                # For mypy, even though we already check this with self.check_model_is_compiled()
-                assert self.fhe_circuit is not None
-
-                # If the inference should be executed using simulation
-                if fhe == "simulate":
-                    is_crt_encoding = self.fhe_circuit.statistics["packing_key_switch_count"] != 0
-
-                    # If the virtual library method should be used
-                    # For now, use the virtual library when simulating
-                    # circuits that use CRT  encoding because the official simulation is too slow
-                    # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/4391
-                    if USE_OLD_VL or is_crt_encoding:
-                        predict_method = partial(
-                            self.fhe_circuit.graph, p_error=self.fhe_circuit.p_error
-                        )  # pragma: no cover
-
-                    # Else, use the official simulation method
-                    else:
-                        predict_method = self.fhe_circuit.simulate
-
-                # Else, use the FHE execution method
+            # For mypy, even though we already check this with self.check_model_is_compiled()
+            assert self.fhe_circuit is not None
+
+            # If the inference should be executed using simulation
+            if fhe == "simulate":
+                is_crt_encoding = self.fhe_circuit.statistics["packing_key_switch_count"] != 0
+
+                # If the virtual library method should be used
+                # For now, use the virtual library when simulating
+                # circuits that use CRT  encoding because the official simulation is too slow
+                # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/4391
+                if USE_OLD_VL or is_crt_encoding:
+                    predict_method = partial(
+                        self.fhe_circuit.graph, p_error=self.fhe_circuit.p_error
+                    )  # pragma: no cover
+
+                # Else, use the official simulation method
                 else:
-                    predict_method = self.fhe_circuit.encrypt_run_decrypt
+                    predict_method = self.fhe_circuit.simulate
+
+            # Else, use the FHE execution method
+            else:
+                predict_method = self.fhe_circuit.encrypt_run_decrypt
+
+            n_examples = q_X.shape[0]
+
+            # The output array is allocated once the output shape is known, that is after the first
+            # example's execution, and then filled in place
+            q_y_pred = numpy.empty((0,))
+            for i in range(n_examples):
+                # Expected encrypt_run_decrypt input shape is (1, n_features). Slicing keeps
+                # that shape and returns a view of the example instead of a copy
+                q_X_i = q_X[i : i + 1]
 
                 # Execute the inference in FHE or with simulation
                 q_y_pred_i = predict_method(q_X_i)
                 assert isinstance(q_y_pred_i, numpy.ndarray)
-                q_y_pred_list.append(q_y_pred_i[0])
 
-            q_y_pred = numpy.array(q_y_pred_list)
+                if i == 0:
+                    q_y_pred = numpy.empty(
+                        (n_examples, *q_y_pred_i.shape[1:]), dtype=q_y_pred_i.dtype
+                    )
+
+                q_y_pred[i] = q_y_pred_i[0]
 
         # Else, the prediction is simulated in the clear
         else:
@@ -650,20 +650,17 @@ def onnx_fp32_model_to_quantized_model(
         ).quantizer
         input_quantizers.append(input_quantizer)
 
-    # Convert thresholds to their quantized equivalent
+    # Convert thresholds to their quantized equivalent. Thresholds are quantized per feature in a
+    # single vectorized call instead of one call per threshold. They are first cast to float64 in
+    # order to get the same precision as when quantizing them one by one
     quantized_thresholds_array = numpy.empty(bias_1.shape, dtype=numpy.int64)
-    dequantized_thresholds_array = numpy.empty(bias_1.shape, dtype=numpy.float64)
+    feature_index_per_threshold = weight_1.argmax(axis=1)
 
-    for threshold_index, threshold_value in enumerate(bias_1[:, 0]):
-        feature_index = int(weight_1[threshold_index, :].argmax())
-        quantized_threshold_value = (
-            input_quantizers[feature_index].quant(threshold_value).astype(numpy.int64)
+    for feature_index, input_quantizer in enumerate(input_quantizers):
+        is_feature_threshold = feature_index_per_threshold == feature_index
+        quantized_thresholds_array[is_feature_threshold, 0] = input_quantizer.quant(
+            bias_1[is_feature_threshold, 0].astype(numpy.float64)
         )
-        dequantized_threshold_value = input_quantizers[feature_index].dequant(
-            quantized_threshold_value
-        )
-        quantized_thresholds_array[threshold_index, 0] = quantized_threshold_value
-        dequantized_thresholds_array[threshold_index, 0] = dequantized_threshold_value
 
     onnx_model.graph.initializer[bias_1_index].CopyFrom(
         numpy_helper.from_array(
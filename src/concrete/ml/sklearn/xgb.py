@@ -223,7 +223,7 @@ class XGBClassifier(BaseTreeClassifierMixin):
         # but also to work around the HB export issue.
         obj._tree_inference = tree_to_numpy(
             obj.sklearn_model,
-            numpy.tile(numpy.zeros((len(obj.input_quantizers),))[None, ...], [2, 1]),
+            numpy.zeros((2, len(obj.input_quantizers))),
             framework=obj.framework,
             output_n_bits=obj.n_bits["op_leaves"] if isinstance(obj.n_bits, Dict) else obj.n_bits,
             fhe_ensembling=obj._fhe_ensembling,
@@ -502,7 +502,7 @@ class XGBRegressor(BaseTreeRegressorMixin):
         # but also to work around the HB export issue.
         obj._tree_inference = tree_to_numpy(
             obj.sklearn_model,
-            numpy.tile(numpy.zeros((len(obj.input_quantizers),))[None, ...], [2, 1]),
+            numpy.zeros((2, len(obj.input_quantizers))),
             framework=obj.framework,
             output_n_bits=obj.n_bits["op_leaves"] if isinstance(obj.n_bits, Dict) else obj.n_bits,
             fhe_ensembling=obj._fhe_ensembling,
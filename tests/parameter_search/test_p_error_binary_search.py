@@ -10,7 +10,11 @@ from sklearn.datasets import make_classification
 from sklearn.metrics import r2_score, top_k_accuracy_score
 
 from concrete.ml.common.check_inputs import check_array_and_assert
-from concrete.ml.common.utils import get_model_name, is_regressor_or_partial_regressor
+from concrete.ml.common.utils import (
+    get_model_class,
+    get_model_name,
+    is_regressor_or_partial_regressor,
+)
 from concrete.ml.pytest.torch_models import QuantCustomModel, TorchCustomModel
 from concrete.ml.pytest.utils import (
     data_calibration_processing,
@@ -49,7 +53,9 @@ MODELS_ARGS = {
         "fp32": {
             "model_class": TorchCustomModel,
             "path": torch.load(
-                (TEST_DATA_DIR / "custom_data_fp32_state_dict.pt"), map_location="cpu"
+                (TEST_DATA_DIR / "custom_data_fp32_state_dict.pt"),
+                map_location="cpu",
+                weights_only=True,
             ),
             "params": {"input_shape": 6, "hidden_shape": 100, "output_shape": 3},
         },
@@ -290,13 +296,15 @@ def test_binary_search_for_custom_models(model_name, quant_type, threshold):
     + get_sklearn_neighbors_models_and_datasets(unique_models=True),
 )
 @pytest.mark.parametrize("predict", ["predict", "predict_proba"])
-def test_binary_search_for_built_in_models(model_class, parameters, threshold, predict, load_data):
+def test_binary_search_for_built_in_models(
+    model_class, parameters, threshold, predict, load_data, is_weekly_option
+):
     """Check if the returned `p_error` is valid for built-in models."""
 
-    x, y = load_data(model_class, **parameters)
-    x_calib, y = data_calibration_processing(data=x, targets=y, n_sample=80)
-
-    model = instantiate_model_generic(model_class, n_bits=4)
+    # The search is the same for both prediction methods, only the compiled model differs. Since
+    # each search compiles the model several times, `predict_proba` is only checked weekly
+    if predict == "predict_proba" and not is_weekly_option:
+        pytest.skip("Tests too long")
 
     # NeuralNetRegressor models support a `predict_proba` method since it directly inherits from
     # Skorch but since Scikit-Learn does not, we don't as well. This issue could be fixed by making
@@ -304,29 +312,34 @@ def test_binary_search_for_built_in_models(model_class, parameters, threshold, p
     # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/3373
     # Skipping predict_proba for KNN, doesn't work for now.
     # FIXME: https://github.com/zama-ai/concrete-ml-internal/issues/3962
-
+    # These checks only need the model class, so they are done before generating the data-set and
+    # instantiating the model
     if predict == "predict_proba" and get_model_name(model_class) in [
         "NeuralNetRegressor",
         "KNeighborsClassifier",
     ]:
         return
 
-    metric = r2_score if is_regressor_or_partial_regressor(model) else binary_classification_metric
+    # The model does not have `predict`
+    if not hasattr(get_model_class(model_class), predict):
+        return
 
-    if hasattr(type(model), predict):
+    x, y = load_data(model_class, **parameters)
+    x_calib, y = data_calibration_processing(data=x, targets=y, n_sample=80)
 
-        search = BinarySearch(
-            estimator=model,
-            predict=predict,
-            metric=metric,
-            n_simulation=2,
-            max_metric_loss=threshold,
-            is_qat=False,
-            max_iter=2,
-        )
-    else:
-        # The model does not have `predict`
-        return
+    model = instantiate_model_generic(model_class, n_bits=4)
+
+    metric = r2_score if is_regressor_or_partial_regressor(model) else binary_classification_metric
+
+    search = BinarySearch(
+        estimator=model,
+        predict=predict,
+        metric=metric,
+        n_simulation=2,
+        max_metric_loss=threshold,
+        is_qat=False,
+        max_iter=2,
+    )
 
     largest_perror = search.run(x=x_calib, ground_truth=y, strategy=all)
 
@@ -1,10 +1,11 @@
 """Test pytest utility functions."""
 
 import numpy
+import pandas
 import pytest
 from numpy.random import RandomState
 
-from concrete.ml.pytest.utils import values_are_equal
+from concrete.ml.pytest.utils import pandas_dataframe_are_equal, values_are_equal
 
 
 @pytest.mark.parametrize(
@@ -39,3 +40,19 @@ def test_values_are_equal(value_1, value_2, expected_output):
         + "equal " * expected_output
         + "different " * (1 - expected_output)
     )
+
+
+@pytest.mark.parametrize(
+    "df_2, expected_output",
+    [
+        pytest.param(pandas.DataFrame({"float": [0.0, 1.0], "str": ["a", "b"]}), True),
+        pytest.param(pandas.DataFrame({"float": [0.0, 2.0], "str": ["a", "b"]}), False),
+        pytest.param(pandas.DataFrame({"float": [0.0, 1.0], "str": ["a", "c"]}), False),
+    ],
+)
+def test_pandas_dataframe_are_equal(df_2, expected_output):
+    """Check that pandas_dataframe_are_equal works properly."""
+
+    df_1 = pandas.DataFrame({"float": [0.0, 1.0], "str": ["a", "b"]})
+
+    assert pandas_dataframe_are_equal(df_1, df_2) == expected_output
@@ -250,7 +250,9 @@ def plot_baseline(param: Dict, data: DataLoader, device: str) -> None:
     """
     # The accuracy of the counterpart pre-trained model in fp32 will be used as a baseline.
     # That we try to catch up during the Quantization Aware Training.
-    checkpoint = torch.load(f"{param['dir']}/{param['pre_trained_path']}", map_location=device)
+    checkpoint = torch.load(
+        f"{param['dir']}/{param['pre_trained_path']}", map_location=device, weights_only=True
+    )
     fp32_vgg = Fp32VGG11(param["output_size"])
     fp32_vgg.load_state_dict(checkpoint)
     baseline = torch_inference(fp32_vgg, data, device)
@@ -36,8 +36,9 @@ def evaluate(torch_model, cml_model, device, num_workers):
         input = input.to(device, non_blocking=True)
         target = target.to(device, non_blocking=True)
 
-        # Compute Torch output
-        torch_output = torch_model(input)
+        # Compute Torch output, without tracking gradients as the model is only evaluated
+        with torch.no_grad():
+            torch_output = torch_model(input)
 
         # Concrete ML inference only handles Numpy inputs
         numpy_input = input.detach().cpu().numpy()
@@ -45,7 +46,8 @@ def evaluate(torch_model, cml_model, device, num_workers):
         # Compute Concrete ML output using simulation
         concrete_output_simulated = cml_model.forward(numpy_input, fhe="simulate")
 
-        concrete_output_simulated = torch.tensor(concrete_output_simulated).to(device)
+        # Build the tensor directly on the device to avoid an intermediate CPU copy
+        concrete_output_simulated = torch.as_tensor(concrete_output_simulated, device=device)
 
         # Compute Torch top accuracies
         torch_top_1, torch_top_5 = accuracy(torch_output, target, topk=(1, 5))